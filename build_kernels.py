@@ -0,0 +1,23 @@
+"""
+Compila por adelantado (AOT) los núcleos de kernels.py en el módulo de
+extensión tem_kernels, para que la app no pague la compilación JIT de Numba
+al arrancar. Ejecutar durante el despliegue:
+
+    python build_kernels.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+import kernels
+
+cc = CC('tem_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('tem_core', kernels.TEM_CORE_SIG)(kernels.tem_core.py_func)
+cc.export('postprocess', kernels.POSTPROCESS_SIG)(kernels.postprocess.py_func)
+cc.export('temporal_only', kernels.TEMPORAL_ONLY_SIG)(kernels.temporal_only.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,112 @@
+"""
+Núcleos numéricos de la línea de placas paralelas (TEM).
+
+Las funciones se compilan con Numba al importar este módulo. Las firmas
+explícitas se reutilizan en build_kernels.py para generar el módulo
+precompilado (AOT) tem_kernels, que tem_app.py carga si está disponible.
+"""
+
+import math
+import cmath
+
+import numpy as np
+from numba import njit
+
+from propagation import TWO_PI, propagation_constants
+
+# Muestreo adaptativo del perfil en z
+N_MIN = 200 # Puntos mínimos del perfil
+N_MAX = 500 # Puntos máximos del perfil
+PUNTOS_POR_LONGITUD_ONDA = 20 # Objetivo de muestreo, limitado a [N_MIN, N_MAX]
+ALFA_L_MAX = 10.0 # Más allá de z = ALFA_L_MAX/alpha la envolvente es despreciable (e^-10)
+
+TEM_CORE_SIG = "Tuple((c16, c16, f8, f8, f8, f8, f8[:], c8[:], c8[:]))(f8, f8, f8, f8, f8, f8, f8, f8)"
+
+@njit(TEM_CORE_SIG, cache=True, fastmath=True)
+def tem_core(f, d, W, sigma_c, mur_c, tan_delta, er, L):
+    """
+    Núcleo numérico compilado con Numba: constantes RLCG, gamma, Z0 y los
+    perfiles V(z), I(z) calculados en una sola pasada sobre z.
+    """
+    
+    # 1. CONSTANTES RLCG, GAMMA Y Z0
+    gamma, Z0, R, L_unit, C, G = propagation_constants(f, d, W, sigma_c, mur_c, tan_delta, er)
+    
+    # 2. PERFILES DE V Y I
+    alpha = gamma.real
+    beta = gamma.imag
+    
+    # Con mucha atenuación el perfil se recorta donde la onda ya se ha extinguido
+    z_max = L
+    if alpha * L > ALFA_L_MAX:
+        z_max = min(L, ALFA_L_MAX / alpha)
+    
+    # Objetivo de PUNTOS_POR_LONGITUD_ONDA puntos por longitud de onda, limitado a
+    # [N_MIN, N_MAX]: en líneas de muchas longitudes de onda (p. ej. 6 GHz, L = 10 m,
+    # ~200 longitudes de onda) el tope N_MAX deja menos puntos y la onda instantánea
+    # queda submuestreada; la envolvente |V(z)|, |I(z)| no se ve afectada.
+    N = int(min(max(PUNTOS_POR_LONGITUD_ONDA * beta * z_max / TWO_PI, N_MIN), N_MAX))
+    
+    z = np.linspace(0, z_max, N)
+    V_input = 1.0 # Tensión de entrada (1V)
+    invZ0 = 1.0 / Z0 # Una sola división compleja en lugar de N
+    
+    # Fasores complejos V(z) e I(z) para una línea adaptada (una sola pasada).
+    # El exponente se evalúa en doble precisión (beta*z puede ser grande) y el
+    # resultado se guarda en complex64, suficiente para la gráfica.
+    V_z = np.empty(N, np.complex64)
+    I_z = np.empty(N, np.complex64)
+    for i in range(N):
+        g = V_input * cmath.exp(-gamma * z[i])
+        V_z[i] = g
+        I_z[i] = g * invZ0
+    
+    return gamma, Z0, R, L_unit, C, G, z, V_z, I_z
+
+
+POSTPROCESS_SIG = "Tuple((f4[:], f4[:], f4[:], f4[:]))(c8[:], c8[:], f8)"
+
+@njit(POSTPROCESS_SIG, cache=True, fastmath=True)
+def postprocess(V_z, I_z, t_fase):
+    """
+    Calcula en una sola pasada la onda instantánea Re{V(z)·e^(jt)}, Re{I(z)·e^(jt)},
+    y las envolventes |V(z)|, |I(z)|.
+    """
+    n = V_z.size
+    V_temporal = np.empty(n, np.float32)
+    I_temporal = np.empty(n, np.float32)
+    V_mag = np.empty(n, np.float32)
+    I_mag = np.empty(n, np.float32)
+    c = math.cos(t_fase)
+    s = math.sin(t_fase)
+    for i in range(n):
+        vr = V_z[i].real
+        vi = V_z[i].imag
+        ir = I_z[i].real
+        ii = I_z[i].imag
+        V_temporal[i] = vr * c - vi * s
+        I_temporal[i] = ir * c - ii * s
+        V_mag[i] = math.hypot(vr, vi)
+        I_mag[i] = math.hypot(ir, ii)
+    
+    return V_temporal, I_temporal, V_mag, I_mag
+
+
+TEMPORAL_ONLY_SIG = "Tuple((f4[:], f4[:]))(c8[:], c8[:], f8)"
+
+@njit(TEMPORAL_ONLY_SIG, cache=True, fastmath=True)
+def temporal_only(V_z, I_z, t_fase):
+    """
+    Calcula únicamente la onda instantánea Re{V(z)·e^(jt)}, Re{I(z)·e^(jt)}.
+    Se usa cuando solo cambia la fase y las envolventes ya están calculadas.
+    """
+    n = V_z.size
+    V_temporal = np.empty(n, np.float32)
+    I_temporal = np.empty(n, np.float32)
+    c = math.cos(t_fase)
+    s = math.sin(t_fase)
+    for i in range(n):
+        V_temporal[i] = V_z[i].real * c - V_z[i].imag * s
+        I_temporal[i] = I_z[i].real * c - I_z[i].imag * s
+    
+    return V_temporal, I_temporal
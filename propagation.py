@@ -0,0 +1,56 @@
+"""
+Constantes RLCG, gamma y Z0 de la línea de placas paralelas (TEM).
+
+Función compartida por los núcleos de kernels.py y por el barrido en
+frecuencia de sweep_kernels.py.
+"""
+
+import math
+import cmath
+
+from numba import njit
+
+# Constantes Físicas (floats de Python: Numba las trata como constantes de compilación)
+MU0 = 4e-7 * math.pi      # Permeabilidad del vacío (H/m)
+EPS0 = 8.854e-12          # Permitividad del vacío (F/m)
+TWO_PI = 2.0 * math.pi
+
+PROPAGATION_SIG = "Tuple((c16, c16, f8, f8, f8, f8))(f8, f8, f8, f8, f8, f8, f8)"
+
+@njit(PROPAGATION_SIG, cache=True, fastmath=True)
+def propagation_constants(f, d, W, sigma_c, mur_c, tan_delta, er):
+    """
+    Constantes RLCG por unidad de longitud, gamma y Z0 a la frecuencia f.
+    """
+    
+    w = TWO_PI * f
+    
+    # 1. CONSTANTES RLCG POR UNIDAD DE LONGITUD
+    
+    # Resistencia (R) - Pérdidas en el conductor (usando Resistencia Superficial Rs)
+    Rs = math.sqrt((math.pi * f * MU0 * mur_c) / sigma_c)
+    R = (2 * Rs) / W  # R por unidad de longitud (para ambas placas)
+    
+    # Inductancia (L)
+    L_unit = MU0 * mur_c * d / W  # H/m (usando mu_r del conductor)
+    
+    # Capacitancia (C)
+    C = EPS0 * er * W / d  # F/m
+    
+    # Conductancia (G) - Pérdidas en el dieléctrico (G = w * C * tan(delta))
+    G = w * C * tan_delta  # S/m
+    
+    # 2. CÁLCULO DE CONSTANTES DE PROPAGACIÓN
+    
+    # Impedancia Serie (Z) y Admitancia Paralelo (Y)
+    Z = R + 1j * w * L_unit
+    Y = G + 1j * w * C
+    
+    # Constante de Propagación (Gamma)
+    ZY = Z * Y
+    gamma = cmath.sqrt(ZY)
+    
+    # Impedancia Característica (Z0)
+    Z0 = cmath.sqrt(Z / Y)
+    
+    return gamma, Z0, R, L_unit, C, G
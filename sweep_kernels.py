@@ -0,0 +1,44 @@
+"""
+Barrido en frecuencia de la línea de placas paralelas (TEM).
+
+tem_sweep usa parallel=True, que no admite compilación AOT, por lo que solo
+existe en versión JIT. Vive en un módulo aparte para que tem_app.py lo importe
+(y Numba lo compile) únicamente cuando se solicita el barrido.
+"""
+
+import os
+import threading
+
+import numpy as np
+from numba import config, njit, prange
+
+from propagation import propagation_constants
+
+# Las sesiones de Streamlit corren en hilos distintos y la capa de hilos
+# "workqueue" de Numba aborta el proceso ante llamadas paralelas concurrentes:
+# toda llamada a tem_sweep debe hacerse con este candado adquirido.
+SWEEP_LOCK = threading.Lock()
+
+# Con TBB el proceso queda colgado al salir si el núcleo paralelo se lanzó desde
+# un hilo de sesión; con el candado, OpenMP o workqueue son seguros.
+if "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ:
+    config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+
+SWEEP_SIG = "Tuple((f8[:], f8[:]))(f8[:], f8, f8, f8, f8, f8, f8)"
+
+@njit(SWEEP_SIG, parallel=True, fastmath=True, cache=True)
+def tem_sweep(f_arr, d, W, sigma_c, mur_c, tan_delta, er):
+    """
+    Barrido en frecuencia: atenuación alpha(f) y fase beta(f) para cada
+    frecuencia de f_arr. Cada frecuencia es independiente y se reparte entre
+    los hilos con prange.
+    """
+    n = f_arr.size
+    alpha = np.empty(n, np.float64)
+    beta = np.empty(n, np.float64)
+    for i in prange(n):
+        gamma = propagation_constants(f_arr[i], d, W, sigma_c, mur_c, tan_delta, er)[0]
+        alpha[i] = gamma.real
+        beta[i] = gamma.imag
+    
+    return alpha, beta
@@ -1,111 +1,121 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import math
+import os
+
+# Núcleos precompilados (python build_kernels.py); si no existen se usa la versión JIT
+try:
+    from tem_kernels import tem_core, postprocess, temporal_only
+except ImportError:
+    from kernels import tem_core, postprocess, temporal_only
 
 # ======================================================================
 # 1. DEFINICIÓN DE MATERIALES (CONDUCTOR Y DIELÉCTRICO)
 # ======================================================================
 
+# Los materiales se guardan como arreglos paralelos (uno por propiedad) indexados
+# por la posición del material, de modo que una propiedad de todos los materiales
+# sea un único arreglo contiguo de float64.
+
 # Materiales conductores (sigma_c, mu_r_conductor)
-MATERIALES_CONDUCTORES = {
-    "Aluminio": [3.82e7, 1.0], 
-    "Cobre": [5.80e7, 1.0],
-    "Oro": [4.10e7, 1.0],
-    "Plata": [6.17e7, 1.0],
-    "Hierro": [1.03e7, 500.0],
-    "Níquel": [1.45e7, 100.0],
-    "Latón": [1.50e7, 1.0],
-    "Zinc": [1.67e7, 1.0],
-    "Tungsteno": [1.82e7, 1.0]
-}
+COND_NAMES = np.array([
+    "Aluminio", "Cobre", "Oro", "Plata", "Hierro",
+    "Níquel", "Latón", "Zinc", "Tungsteno"
+])
+COND_SIGMA = np.array([
+    3.82e7, 5.80e7, 4.10e7, 6.17e7, 1.03e7, 1.45e7,
+    1.50e7, 1.67e7, 1.82e7
+], np.float64)
+COND_MUR = np.array([
+    1.0, 1.0, 1.0, 1.0, 500.0, 100.0,
+    1.0, 1.0, 1.0
+], np.float64)
 
 # Materiales dieléctricos (tan_delta, mu_r_diel, epsilon_r)
-MATERIALES_DIELECTRICOS = {
-    "Aire": [0, 1.0, 1.0005],
-    "Alcohol_etílico": [100.00e-3, 1.0, 25.0],
-    "Oxido_de_aluminio": [0.60e-3, 1.0, 8.8],
-    "Baquelita": [22.00e-3, 1.0, 4.74],
-    "Dióxido_de_carbono": [0, 1.0, 1.001],
-    "Vidrio": [2.00e-3, 1.0, 4.0],
-    "Hielo": [50.00e-3, 1.0, 4.2],
-    "Mica": [0.60e-3, 1.0, 5.4],
-    "Nylon": [20.00e-3, 1.0, 3.5],
-    "Papel": [8.00e-3, 1.0, 3.0],
-    "Plexiglás": [30.00e-3, 1.0, 3.45],
-    "Polietileno": [0.20e-3, 1.0, 2.26],
-    "Polipropileno": [0.30e-3, 1.0, 2.25],
-    "Poliestireno": [0.05e-3, 1.0, 2.56],
-    "Porcelana": [14.00e-3, 1.0, 6.0],
-    "Vidrio_Pyrex": [0.60e-3, 1.0, 4.0],
-    "Cuarzo": [0.75e-3, 1.0, 3.8],
-    "Hule": [2.00e-3, 1.0, 2.5],
-    "Nieve": [500.00e-3, 1.0, 3.3],
-    "Tierra_seca": [50.00e-3, 1.0, 2.8],
-    "Teflon": [0.30e-3, 1.0, 2.1],
-    "Madera_seca": [10.00e-3, 1.0, 1.5]
-}
+DIEL_NAMES = np.array([
+    "Aire", "Alcohol_etílico", "Oxido_de_aluminio", "Baquelita", "Dióxido_de_carbono",
+    "Vidrio", "Hielo", "Mica", "Nylon", "Papel",
+    "Plexiglás", "Polietileno", "Polipropileno", "Poliestireno", "Porcelana",
+    "Vidrio_Pyrex", "Cuarzo", "Hule", "Nieve", "Tierra_seca",
+    "Teflon", "Madera_seca"
+])
+DIEL_TAN_DELTA = np.array([
+    0, 100.00e-3, 0.60e-3, 22.00e-3, 0, 2.00e-3,
+    50.00e-3, 0.60e-3, 20.00e-3, 8.00e-3, 30.00e-3, 0.20e-3,
+    0.30e-3, 0.05e-3, 14.00e-3, 0.60e-3, 0.75e-3, 2.00e-3,
+    500.00e-3, 50.00e-3, 0.30e-3, 10.00e-3
+], np.float64)
+DIEL_MUR = np.array([
+    1.0, 1.0, 1.0, 1.0, 1.0, 1.0,
+    1.0, 1.0, 1.0, 1.0, 1.0, 1.0,
+    1.0, 1.0, 1.0, 1.0, 1.0, 1.0,
+    1.0, 1.0, 1.0, 1.0
+], np.float64)
+DIEL_ER = np.array([
+    1.0005, 25.0, 8.8, 4.74, 1.001, 4.0,
+    4.2, 5.4, 3.5, 3.0, 3.45, 2.26,
+    2.25, 2.56, 6.0, 4.0, 3.8, 2.5,
+    3.3, 2.8, 2.1, 1.5
+], np.float64)
 
 
 # ----------------------------------------------------------------------
 # 2. FUNCIÓN DE CÁLCULO PARA LÍNEA DE PLACAS PARALELAS (TEM)
 # ----------------------------------------------------------------------
 
-def calculate_tem(f, d, W, conductor_data, dielectric_data, L):
+@st.cache_data(max_entries=64)
+def calculate_tem(f, d, W, i_cond, i_diel, L):
     """
     Calcula la propagación TEM para una línea de placas paralelas, 
     incluyendo pérdidas del conductor (R) y del dieléctrico (G).
+
+    i_cond e i_diel son los índices del material en los arreglos COND_* y DIEL_*.
+    El resultado se memoriza con st.cache_data. La fase de visualización (t_fase)
+    se aplica fuera de esta función, por lo que mover el slider de fase no vuelve
+    a ejecutar el cálculo.
     """
     
-    # Constantes Físicas
-    mu0 = 4 * np.pi * 1e-7      # Permeabilidad del vacío (H/m)
-    eps0 = 8.854e-12    # Permitividad del vacío (F/m)
-    w = 2 * np.pi * f
-    
     # Datos del conductor
-    sigma_c = conductor_data[0]
-    mur_c = conductor_data[1]    
+    sigma_c = COND_SIGMA[i_cond]
+    mur_c = COND_MUR[i_cond]
     
     # Datos del dieléctrico
-    tan_delta = dielectric_data[0] # Tangente de pérdidas
-    er = dielectric_data[2]      # Permitividad relativa
-    
-    # 1. CONSTANTES RLCG POR UNIDAD DE LONGITUD
-    
-    # Resistencia (R) - Pérdidas en el conductor (usando Resistencia Superficial Rs)
-    Rs = np.lib.scimath.sqrt((np.pi * f * mu0 * mur_c) / sigma_c)
-    R = (2 * Rs) / W  # R por unidad de longitud (para ambas placas)
-    
-    # Inductancia (L)
-    L_unit = mu0 * mur_c * d / W  # H/m (usando mu_r del conductor)
-    
-    # Capacitancia (C)
-    C = eps0 * er * W / d  # F/m
-    
-    # Conductancia (G) - Pérdidas en el dieléctrico (G = w * C * tan(delta))
-    G = w * C * tan_delta  # S/m
-    
-    # 2. CÁLCULO DE CONSTANTES DE PROPAGACIÓN
+    tan_delta = DIEL_TAN_DELTA[i_diel] # Tangente de pérdidas
+    er = DIEL_ER[i_diel]      # Permitividad relativa
     
-    # Impedancia Serie (Z) y Admitancia Paralelo (Y)
-    Z = R + 1j * w * L_unit
-    Y = G + 1j * w * C
-    
-    # Constante de Propagación (Gamma)
-    gamma = np.lib.scimath.sqrt(Z * Y)
-    
-    # Impedancia Característica (Z0)
-    Z0 = np.lib.scimath.sqrt(Z / Y)
-    
-    # 3. PERFILES DE V Y I
-    z = np.linspace(0, L, 500) # Aumentamos los puntos para mejor visualización de la onda
-    V_input = 1.0 # Tensión de entrada (1V)
+    return tem_core(float(f), float(d), float(W), float(sigma_c), float(mur_c),
+                     float(tan_delta), float(er), float(L))
+
+
+N_BARRIDO = 400 # Frecuencias del barrido alpha(f), beta(f)
+
+@st.cache_data(max_entries=64)
+def calculate_sweep(d, W, i_cond, i_diel):
+    """
+    Barrido en frecuencia de alpha y beta sobre el rango del slider de
+    frecuencia (escala logarítmica), calculado en paralelo con tem_sweep.
+    """
+    # parallel=True no admite AOT: tem_sweep siempre es JIT y se importa solo al usarse
+    from sweep_kernels import SWEEP_LOCK, tem_sweep
     
-    # Fasores complejos V(z) e I(z) para una línea adaptada
-    V_z = V_input * np.exp(-gamma * z) 
-    I_z = V_z / Z0
+    f_arr = np.logspace(6, 10, N_BARRIDO)
+    with SWEEP_LOCK:
+        alpha, beta = tem_sweep(f_arr, float(d), float(W), float(COND_SIGMA[i_cond]), float(COND_MUR[i_cond]),
+                                float(DIEL_TAN_DELTA[i_diel]), float(DIEL_ER[i_diel]))
     
-    return gamma, Z0, R, L_unit, C, G, z, V_z, I_z
+    return f_arr, alpha, beta
+
+
+SVG_ESQUEMA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "tem_schema.svg")
+
+@st.cache_resource
+def _load_svg():
+    """Lee el esquema SVG de la sección transversal (se carga una sola vez)."""
+    with open(SVG_ESQUEMA, encoding="utf-8") as fh:
+        # Comprimido en una sola línea para que st.markdown no lo trate como bloque de código
+        svg = "".join(line.strip() for line in fh)
+    return f'<div style="text-align: center; margin: 15px 0;">{svg}</div>'
 
 # ----------------------------------------------------------------------
 # 3. DISEÑO DE LA INTERFAZ CON STREAMLIT
@@ -121,55 +131,36 @@ col_left, col_right = st.columns([1, 3])
 
 # --- Columna de Configuración con estilo (col_left) ---
 with col_left:
-    # Contenedor para dar un toque de color y agrupar la configuración
-    with st.container(border=True): 
+    # Formulario para dar un toque de color y agrupar la configuración: los cambios
+    # se aplican todos juntos al pulsar el botón, en una sola ejecución del script
+    with st.form('params'):
         st.info("Configuración de la Línea")
         
         # Frecuencia
         f = st.slider("Frecuencia (Hz)", 1e6, 10e9, 6e9, format="%e") 
         
-        # Control de Fase
-        t_fase = st.slider("Fase de Visualización (Tiempo Angular)", 0.0, 2 * np.pi, 0.0, format="%.2f", help="Ajusta la fase angular (wt) para la gráfica de onda instantánea.")
-        
         st.info("Propiedades del Material")
         
         # SELECTOR DE MATERIAL CONDUCTOR
-        material_conductor_name = st.selectbox(
+        i_cond = st.selectbox(
             "1. Placas Conductoras (Material):",
-            options=list(MATERIALES_CONDUCTORES.keys()),
+            options=range(len(COND_NAMES)),
+            format_func=lambda i: COND_NAMES[i],
             key='sel_cond'
         )
-        conductor_data = MATERIALES_CONDUCTORES[material_conductor_name]
         
         # SELECTOR DE MATERIAL DIELÉCTRICO
-        material_diel_name = st.selectbox(
+        i_diel = st.selectbox(
             "2. Dieléctrico (Material):",
-            options=list(MATERIALES_DIELECTRICOS.keys()),
+            options=range(len(DIEL_NAMES)),
+            format_func=lambda i: DIEL_NAMES[i],
             key='sel_diel'
         )
-        dielectric_data = MATERIALES_DIELECTRICOS[material_diel_name]
         
         st.info("Geometría")
         
-        # Bloque SVG **Comprimido en una sola línea** para asegurar el renderizado
-        svg_code = """
-        <div style="text-align: center; margin: 15px 0;">
-            <svg width="200" height="100" viewBox="0 0 200 100" xmlns="http://www.w3.org/2000/svg">
-                <rect x="10" y="10" width="180" height="10" style="fill: #808080; stroke: black; stroke-width: 1;"/>
-                <text x="100" y="5" font-size="10" text-anchor="middle">Conductor Superior</text>
-                <rect x="10" y="80" width="180" height="10" style="fill: #808080; stroke: black; stroke-width: 1;"/>
-                <text x="100" y="98" font-size="10" text-anchor="middle">Conductor Inferior</text>
-                <rect x="10" y="20" width="180" height="60" style="fill: #ADD8E6; opacity: 0.5;"/>
-                <line x1="190" y1="10" x2="190" y2="90" style="stroke: #FF4B4B; stroke-width: 1;"/>
-                <text x="195" y="50" font-size="10" fill="#FF4B4B">W (Ancho)</text>
-                <line x1="5" y1="20" x2="5" y2="80" style="stroke: #FF4B4B; stroke-width: 1;"/>
-                <line x1="5" y1="20" x2="10" y2="20" style="stroke: #FF4B4B; stroke-width: 1;"/>
-                <line x1="5" y1="80" x2="10" y2="80" style="stroke: #FF4B4B; stroke-width: 1;"/>
-                <text x="0" y="50" font-size="10" fill="#FF4B4B" text-anchor="end">d (Sep.)</text>
-            </svg>
-        </div>
-        """
-        st.markdown(svg_code, unsafe_allow_html=True)
+        # Esquema de la sección transversal (archivo estático, leído una sola vez)
+        st.markdown(_load_svg(), unsafe_allow_html=True)
         st.markdown("<i style='font-size: 10px; display: block; text-align: center; margin-top: -10px;'>Esquema de la sección transversal (no a escala).</i>", unsafe_allow_html=True)
 
 
@@ -177,13 +168,19 @@ with col_left:
         W = st.number_input("Ancho de Placas (W en m)", value=0.1, format="%e", min_value=1e-3)
         L = st.number_input("Longitud de la Línea (L en m)", value=10.0, min_value=0.001)
 
-    st.markdown("---")
-    # Botón más visual (usando la API de color de Streamlit)
-    if st.button("Calcular Propagación", use_container_width=True, type="primary"):
+        st.markdown("---")
+        # Botón más visual (usando la API de color de Streamlit)
+        submitted = st.form_submit_button("Calcular Propagación", use_container_width=True, type="primary")
+
+    if submitted:
         st.session_state['run_calc'] = True
     elif 'run_calc' not in st.session_state:
         st.session_state['run_calc'] = False
 
+    # Control de Fase (fuera del formulario para actualizar la gráfica en vivo)
+    with st.container(border=True):
+        t_fase = st.slider("Fase de Visualización (Tiempo Angular)", 0.0, 2 * math.pi, 0.0, format="%.2f", help="Ajusta la fase angular (wt) para la gráfica de onda instantánea.")
+
 # ----------------------------------------------------------------------
 # 4. EJECUCIÓN Y VISUALIZACIÓN
 # ----------------------------------------------------------------------
@@ -193,14 +190,24 @@ with col_right:
 
     if st.session_state.get('run_calc', False):
         try:
-            # Ejecutar la función
-            gamma, Z0, R, L_unit, C, G, z, V_z, I_z = calculate_tem(f, d, W, conductor_data, dielectric_data, L)
+            # Parámetros de entrada (los materiales se pasan por índice)
+            params = (f, d, W, i_cond, i_diel, L)
+            cached = st.session_state.get('cached')
             
-            # --- DATOS PARA GRÁFICAS DE ONDA COMPLETA (NO ABSOLUTO) ---
-            V_temporal = np.real(V_z * np.exp(1j * t_fase))
-            I_temporal = np.real(I_z * np.exp(1j * t_fase))
-            V_mag = np.abs(V_z)
-            I_mag = np.abs(I_z)
+            if cached is None or cached[0] != params:
+                # Ejecutar la función (memorizada) y calcular envolventes y onda instantánea
+                resultados = calculate_tem(*params)
+                gamma, Z0, R, L_unit, C, G, z, V_z, I_z = resultados
+                
+                # --- DATOS PARA GRÁFICAS DE ONDA COMPLETA (NO ABSOLUTO) ---
+                V_temporal, I_temporal, V_mag, I_mag = postprocess(V_z, I_z, t_fase)
+                st.session_state['cached'] = (params, resultados, (V_mag, I_mag))
+            else:
+                # Solo cambió la fase: se reutilizan el cálculo y las envolventes
+                _, resultados, envolventes = cached
+                gamma, Z0, R, L_unit, C, G, z, V_z, I_z = resultados
+                V_mag, I_mag = envolventes
+                V_temporal, I_temporal = temporal_only(V_z, I_z, t_fase)
             
             # ------------------------------------------------------------------
             # DETALLE DE PROPIEDADES Y RESULTADOS
@@ -211,15 +218,15 @@ with col_right:
                 col_prop1, col_prop2 = st.columns(2)
                 
                 # Propiedades del Conductor
-                col_prop1.markdown(f"**Conductor:** `{material_conductor_name}`")
-                col_prop1.markdown(f"$\sigma_c$: **{conductor_data[0]:.2e}** S/m")
-                col_prop1.markdown(f"$\mu_r$: **{conductor_data[1]}**")
+                col_prop1.markdown(f"**Conductor:** `{COND_NAMES[i_cond]}`")
+                col_prop1.markdown(f"$\sigma_c$: **{COND_SIGMA[i_cond]:.2e}** S/m")
+                col_prop1.markdown(f"$\mu_r$: **{COND_MUR[i_cond]}**")
 
                 # Propiedades del Dieléctrico
-                col_prop2.markdown(f"**Dieléctrico:** `{material_diel_name}`")
-                col_prop2.markdown(f"$\epsilon_r$: **{dielectric_data[2]:.3f}**")
+                col_prop2.markdown(f"**Dieléctrico:** `{DIEL_NAMES[i_diel]}`")
+                col_prop2.markdown(f"$\epsilon_r$: **{DIEL_ER[i_diel]:.3f}**")
                 # Se mantiene la notación LaTeX para evitar errores de traducción
-                col_prop2.markdown(f"$$\\tan\\delta$$: **{dielectric_data[0]:.2e}**")
+                col_prop2.markdown(f"$$\\tan\\delta$$: **{DIEL_TAN_DELTA[i_diel]:.2e}**")
 
 
             # Constantes de Propagación
@@ -241,54 +248,107 @@ with col_right:
                 col_cg.metric(label="Capacitancia (C)", value=f"{C:.4e} F/m")
                 col_cg.metric(label="Conductancia (G)", value=f"{G:.4e} S/m")
 
+            # Barrido en frecuencia (se calcula solo si se solicita)
+            with st.expander("Barrido en Frecuencia: α(f) y β(f)", expanded=False):
+                if st.checkbox("Calcular barrido en frecuencia", key='run_sweep'):
+                    f_arr, alpha_f, beta_f = calculate_sweep(d, W, i_cond, i_diel)
+                    
+                    if 'fig3' not in st.session_state:
+                        fig3 = Figure(figsize=(10, 4))
+                        ax3 = fig3.subplots()
+                        ax3b = ax3.twinx()
+                        ax3.loglog([], [], color='#d62728', label=r'$\alpha(f)$', linewidth=2) # Rojo
+                        ax3b.loglog([], [], color='#1f77b4', linestyle='--', label=r'$\beta(f)$', linewidth=2) # Azul
+                        ax3.set_title("Constantes de Propagación vs. Frecuencia")
+                        ax3.set_xlabel("Frecuencia (Hz)")
+                        ax3.set_ylabel("Atenuación α (Np/m)")
+                        ax3b.set_ylabel("Fase β (rad/m)")
+                        ax3.legend(handles=ax3.lines + ax3b.lines, loc='upper left')
+                        ax3.grid(True, which='both', linestyle=':', alpha=0.6)
+                        st.session_state['fig3'] = (fig3, ax3, ax3b)
+                    
+                    fig3, ax3, ax3b = st.session_state['fig3']
+                    ax3.lines[0].set_data(f_arr, alpha_f)
+                    ax3b.lines[0].set_data(f_arr, beta_f)
+                    for ax in (ax3, ax3b):
+                        ax.relim()
+                        ax.autoscale_view()
+                    st.pyplot(fig3)
+
             st.markdown("---") 
 
             st.info("Perfiles de Tensión y Corriente")
 
+            # Las figuras se crean una sola vez por sesión; en cada ejecución solo
+            # se actualizan los datos de las curvas y los límites de los ejes. Se usa
+            # Figure directamente (no plt) para que no queden registradas en pyplot.
+
             # Figura 1: Tensión V(z)
-            fig1, ax1 = plt.subplots(figsize=(10, 4))
-            
-            # 1. Gráfica de la onda instantánea (parte real del fasor)
-            ax1.plot(z, V_temporal, color='#1f77b4', label=r'$v(z, t_0)$', linewidth=2, alpha=0.8) # Azul
-            
-            # 2. Gráfica de la envolvente de atenuación (|V(z)|)
-            ax1.plot(z, V_mag, 'r--', label='$|V(z)|$', linewidth=1.5, alpha=0.6) # Rojo claro para envolvente
-            ax1.plot(z, -V_mag, 'r--', linewidth=1.5, alpha=0.6) # Envolvente negativa
+            if 'fig1' not in st.session_state:
+                fig1 = Figure(figsize=(10, 4))
+                ax1 = fig1.subplots()
+                
+                # 1. Gráfica de la onda instantánea (parte real del fasor)
+                ax1.plot([], [], color='#1f77b4', label=r'$v(z, t_0)$', linewidth=2, alpha=0.8) # Azul
+                
+                # 2. Gráfica de la envolvente de atenuación (|V(z)|)
+                ax1.plot([], [], 'r--', label='$|V(z)|$', linewidth=1.5, alpha=0.6) # Rojo claro para envolvente
+                ax1.plot([], [], 'r--', linewidth=1.5, alpha=0.6) # Envolvente negativa
+                
+                ax1.axhline(0, color='black', linestyle='-', linewidth=0.5) # Eje de las abscisas más oscuro
+                ax1.set_title(f"Perfil de Tensión - Onda Instantánea y Atenuación")
+                ax1.set_xlabel("Posición z (m)")
+                ax1.set_ylabel("Tensión (V)")
+                ax1.legend()
+                ax1.grid(True, linestyle=':', alpha=0.6)
+                st.session_state['fig1'] = (fig1, ax1)
             
-            ax1.axhline(0, color='black', linestyle='-', linewidth=0.5) # Eje de las abscisas más oscuro
-            ax1.set_title(f"Perfil de Tensión - Onda Instantánea y Atenuación")
-            ax1.set_xlabel("Posición z (m)")
-            ax1.set_ylabel("Tensión (V)")
-            ax1.legend()
-            ax1.grid(True, linestyle=':', alpha=0.6)
-            y_limit = np.max(V_mag) * 1.05
+            fig1, ax1 = st.session_state['fig1']
+            ax1.lines[0].set_data(z, V_temporal)
+            ax1.lines[1].set_data(z, V_mag)
+            ax1.lines[2].set_data(z, -V_mag)
+            ax1.relim()
+            ax1.autoscale_view(scaley=False)
+            # Línea adaptada: |V(z)| = |V_input|·e^(-alpha·z) es máximo en z = 0 (V_input = 1 V)
+            y_limit = 1.05
             ax1.set_ylim(-y_limit, y_limit)
             st.pyplot(fig1)
 
             # Figura 2: Corriente I(z)
-            fig2, ax2 = plt.subplots(figsize=(10, 4))
-            
-            # 1. Gráfica de la onda instantánea (parte real del fasor)
-            ax2.plot(z, I_temporal, color='#2ca02c', label=r'$i(z, t_0)$', linewidth=2, alpha=0.8) # Verde
-            
-            # 2. Gráfica de la envolvente de atenuación (|I(z)|)
-            ax2.plot(z, I_mag, color='#9467bd', linestyle='--', label='$|I(z)|$', linewidth=1.5, alpha=0.6) # Púrpura claro para envolvente
-            ax2.plot(z, -I_mag, color='#9467bd', linestyle='--', linewidth=1.5, alpha=0.6) # Envolvente negativa
+            if 'fig2' not in st.session_state:
+                fig2 = Figure(figsize=(10, 4))
+                ax2 = fig2.subplots()
+                
+                # 1. Gráfica de la onda instantánea (parte real del fasor)
+                ax2.plot([], [], color='#2ca02c', label=r'$i(z, t_0)$', linewidth=2, alpha=0.8) # Verde
+                
+                # 2. Gráfica de la envolvente de atenuación (|I(z)|)
+                ax2.plot([], [], color='#9467bd', linestyle='--', label='$|I(z)|$', linewidth=1.5, alpha=0.6) # Púrpura claro para envolvente
+                ax2.plot([], [], color='#9467bd', linestyle='--', linewidth=1.5, alpha=0.6) # Envolvente negativa
+                
+                ax2.axhline(0, color='black', linestyle='-', linewidth=0.5) # Eje de las abscisas más oscuro
+                ax2.set_title(f"Perfil de Corriente - Onda Instantánea y Atenuación")
+                ax2.set_xlabel("Posición z (m)")
+                ax2.set_ylabel("Corriente (A)")
+                ax2.legend()
+                ax2.grid(True, linestyle=':', alpha=0.6)
+                st.session_state['fig2'] = (fig2, ax2)
             
-            ax2.axhline(0, color='black', linestyle='-', linewidth=0.5) # Eje de las abscisas más oscuro
-            ax2.set_title(f"Perfil de Corriente - Onda Instantánea y Atenuación")
-            ax2.set_xlabel("Posición z (m)")
-            ax2.set_ylabel("Corriente (A)")
-            ax2.legend()
-            ax2.grid(True, linestyle=':', alpha=0.6)
-            y_limit = np.max(I_mag) * 1.05
+            fig2, ax2 = st.session_state['fig2']
+            ax2.lines[0].set_data(z, I_temporal)
+            ax2.lines[1].set_data(z, I_mag)
+            ax2.lines[2].set_data(z, -I_mag)
+            ax2.relim()
+            ax2.autoscale_view(scaley=False)
+            # Análogamente, el máximo de |I(z)| es |V_input|/|Z0|
+            y_limit = 1.05 / np.abs(Z0)
             ax2.set_ylim(-y_limit, y_limit)
             st.pyplot(fig2)
 
         except Exception as e:
             st.error(f"Error en el cálculo: {e}")
             st.error("Asegúrate de que los parámetros de entrada sean válidos.")
-            st.info("Nota: Para frecuencias y pérdidas muy altas, las funciones como np.lib.scimath.sqrt manejan correctamente los números complejos.")
+            st.info("Nota: Para frecuencias y pérdidas muy altas, funciones como cmath.sqrt manejan correctamente los números complejos.")
 
     else:
         st.info("Presiona 'Calcular Propagación' para iniciar la simulación y ver los resultados.")
\ No newline at end of file